@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+import sys
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from weakref import WeakSet
 
 from . import utils
 from .asset import Asset
@@ -10,8 +12,11 @@ from .flags import ApplicationFlags
 from .permissions import Permissions
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from .guild import Guild
     from .state import ConnectionState
+    from .team import Team
     from .types.appinfo import (
         AppInfo as AppInfoPayload,
         InstallParams as InstallParamsPayload,
@@ -26,6 +31,10 @@ __all__ = (
     "InstallParams",
 )
 
+# instances that have already emitted the `summary` deprecation warning.
+# NOTE: this requires a `__weakref__` slot on both classes, i.e. one extra pointer per instance.
+_summary_warned: WeakSet[Union[AppInfo, PartialAppInfo]] = WeakSet()
+
 
 class InstallParams:
     """Represents the installation parameters for the application, provided by Discord.
@@ -34,8 +43,11 @@ class InstallParams:
 
     Attributes
     ----------
-    scopes: List[:class:`str`]
+    scopes: Tuple[:class:`str`, ...]
         The scopes requested by the application.
+
+        .. versionchanged:: 2.10
+            This is now a :class:`tuple` instead of a :class:`list`.
     permissions: :class:`Permissions`
         The permissions requested for the bot role.
     """
@@ -48,8 +60,12 @@ class InstallParams:
 
     def __init__(self, data: InstallParamsPayload, parent: AppInfo) -> None:
         self._app_id = parent.id
-        self.scopes = data["scopes"]
-        self.permissions = Permissions(int(data["permissions"]))
+        self.scopes: Tuple[str, ...] = tuple(sys.intern(scope) for scope in data["scopes"])
+        permissions: Union[int, str] = data["permissions"]
+        # payloads from the API contain a string, but rehydrated/cached payloads may already be ints
+        self.permissions = Permissions(
+            permissions if type(permissions) is int else int(permissions)
+        )
 
     def __repr__(self) -> str:
         return f"<InstallParams scopes={self.scopes!r} permissions={self.permissions!r}>"
@@ -76,11 +92,6 @@ class AppInfo:
         The application's name.
     owner: :class:`User`
         The application's owner.
-    team: Optional[:class:`Team`]
-        The application's team.
-
-        .. versionadded:: 1.3
-
     description: :class:`str`
         The application's description.
     bot_public: :class:`bool`
@@ -135,11 +146,6 @@ class AppInfo:
 
         .. versionadded:: 2.5
 
-    install_params: Optional[:class:`InstallParams`]
-        The installation parameters for this application.
-
-        .. versionadded:: 2.5
-
     custom_install_url: Optional[:class:`str`]
         The custom installation url for this application.
 
@@ -173,7 +179,8 @@ class AppInfo:
         "_icon",
         "_summary",
         "verify_key",
-        "team",
+        "_team_data",
+        "_cs_team",
         "guild_id",
         "primary_sku_id",
         "slug",
@@ -182,16 +189,16 @@ class AppInfo:
         "privacy_policy_url",
         "flags",
         "tags",
-        "install_params",
+        "_install_params_data",
+        "_cs_install_params",
         "custom_install_url",
         "role_connections_verification_url",
         "approximate_guild_count",
         "approximate_user_install_count",
+        "__weakref__",
     )
 
     def __init__(self, state: ConnectionState, data: AppInfoPayload) -> None:
-        from .team import Team
-
         self._state: ConnectionState = state
         self.id: int = int(data["id"])
         self.name: str = data["name"]
@@ -202,15 +209,14 @@ class AppInfo:
         self.bot_require_code_grant: bool = data["bot_require_code_grant"]
         self.owner: User = state.create_user(data["owner"])
 
-        team: Optional[TeamPayload] = data.get("team")
-        self.team: Optional[Team] = Team(state, team) if team else None
+        self._team_data: Optional[TeamPayload] = data.get("team")
 
         self._summary: str = data.get("summary", "")
         self.verify_key: str = data["verify_key"]
 
-        self.guild_id: Optional[int] = utils._get_as_snowflake(data, "guild_id")
-
-        self.primary_sku_id: Optional[int] = utils._get_as_snowflake(data, "primary_sku_id")
+        get_as_snowflake = utils._get_as_snowflake
+        self.guild_id: Optional[int] = get_as_snowflake(data, "guild_id")
+        self.primary_sku_id: Optional[int] = get_as_snowflake(data, "primary_sku_id")
         self.slug: Optional[str] = data.get("slug")
         self._cover_image: Optional[str] = data.get("cover_image")
         self.terms_of_service_url: Optional[str] = data.get("terms_of_service_url")
@@ -221,9 +227,7 @@ class AppInfo:
             ApplicationFlags._from_value(flags) if flags is not None else None
         )
         self.tags: Optional[List[str]] = data.get("tags")
-        self.install_params: Optional[InstallParams] = (
-            InstallParams(data["install_params"], parent=self) if "install_params" in data else None
-        )
+        self._install_params_data: Optional[InstallParamsPayload] = data.get("install_params")
         self.custom_install_url: Optional[str] = data.get("custom_install_url")
         self.role_connections_verification_url: Optional[str] = data.get(
             "role_connections_verification_url"
@@ -238,6 +242,31 @@ class AppInfo:
             f"owner={self.owner!r}>"
         )
 
+    @classmethod
+    def from_bytes(cls, state: ConnectionState, data: Union[bytes, str]) -> Self:
+        """Creates an :class:`AppInfo` from a raw JSON-encoded application payload,
+        e.g. application info previously persisted to disk.
+
+        This decodes the payload using ``orjson`` if it is installed,
+        and falls back to the standard library's :mod:`json` module otherwise.
+
+        .. versionadded:: 2.10
+
+        Parameters
+        ----------
+        state: ``ConnectionState``
+            The client's internal connection state (``client._connection``)
+            to attach to the application info.
+        data: Union[:class:`bytes`, :class:`str`]
+            The JSON-encoded application payload, as returned by Discord.
+
+        Returns
+        -------
+        :class:`AppInfo`
+            The decoded application info.
+        """
+        return cls(state, utils._from_json(data))
+
     @property
     def icon(self) -> Optional[Asset]:
         """Optional[:class:`.Asset`]: Retrieves the application's icon asset, if any."""
@@ -263,6 +292,29 @@ class AppInfo:
         """
         return self._state._get_guild(self.guild_id)
 
+    @utils.cached_slot_property("_cs_team")
+    def team(self) -> Optional[Team]:
+        """Optional[:class:`Team`]: The application's team.
+
+        .. versionadded:: 1.3
+        """
+        if not self._team_data:
+            return None
+
+        from .team import Team
+
+        return Team(self._state, self._team_data)
+
+    @utils.cached_slot_property("_cs_install_params")
+    def install_params(self) -> Optional[InstallParams]:
+        """Optional[:class:`InstallParams`]: The installation parameters for this application.
+
+        .. versionadded:: 2.5
+        """
+        if install_params := self._install_params_data:
+            return InstallParams(install_params, parent=self)
+        return None
+
     @property
     def summary(self) -> str:
         """:class:`str`: If this application is a game sold on Discord,
@@ -274,10 +326,12 @@ class AppInfo:
 
             This field is deprecated by discord and is now always blank. Consider using :attr:`.description` instead.
         """
-        utils.warn_deprecated(
-            "summary is deprecated and will be removed in a future version. Consider using description instead.",
-            stacklevel=2,
-        )
+        if self not in _summary_warned:
+            utils.warn_deprecated(
+                "summary is deprecated and will be removed in a future version. Consider using description instead.",
+                stacklevel=2,
+            )
+            _summary_warned.add(self)
         return self._summary
 
 
@@ -311,11 +365,11 @@ class PartialAppInfo:
         "name",
         "description",
         "rpc_origins",
-        "_summary",
         "verify_key",
         "terms_of_service_url",
         "privacy_policy_url",
         "_icon",
+        "__weakref__",
     )
 
     def __init__(self, *, state: ConnectionState, data: PartialAppInfoPayload) -> None:
@@ -325,7 +379,6 @@ class PartialAppInfo:
         self._icon: Optional[str] = data.get("icon")
         self.description: str = data["description"]
         self.rpc_origins: Optional[List[str]] = data.get("rpc_origins")
-        self._summary: str = data.get("summary", "")
         self.verify_key: str = data["verify_key"]
         self.terms_of_service_url: Optional[str] = data.get("terms_of_service_url")
         self.privacy_policy_url: Optional[str] = data.get("privacy_policy_url")
@@ -349,8 +402,10 @@ class PartialAppInfo:
 
             This field is deprecated by discord and is now always blank. Consider using :attr:`.description` instead.
         """
-        utils.warn_deprecated(
-            "summary is deprecated and will be removed in a future version. Consider using description instead.",
-            stacklevel=2,
-        )
-        return self._summary
+        if self not in _summary_warned:
+            utils.warn_deprecated(
+                "summary is deprecated and will be removed in a future version. Consider using description instead.",
+                stacklevel=2,
+            )
+            _summary_warned.add(self)
+        return ""
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional
 
 from ..enums import ComponentType
 from ..message import Message
@@ -17,9 +18,12 @@ if TYPE_CHECKING:
         ModalInteractionComponentData as ModalInteractionComponentDataPayload,
         ModalInteractionData as ModalInteractionDataPayload,
     )
+    from ..types.message import Message as MessagePayload
 
 __all__ = ("ModalInteraction", "ModalInteractionData")
 
+_TEXT_INPUT_TYPE = ComponentType.text_input.value
+
 
 class ModalInteraction(Interaction[ClientT]):
     """Represents an interaction with a modal.
@@ -82,48 +86,51 @@ class ModalInteraction(Interaction[ClientT]):
 
     data: :class:`ModalInteractionData`
         The wrapped interaction data.
-    message: Optional[:class:`Message`]
-        The message that this interaction's modal originated from,
-        if the modal was sent in response to a component interaction.
-
-        .. versionadded:: 2.5
     """
 
-    __slots__ = ("message", "_cs_text_values")
+    __slots__ = ("_message_data", "_cs_message", "_cs_text_values")
 
     def __init__(self, *, data: ModalInteractionPayload, state: ConnectionState) -> None:
         super().__init__(data=data, state=state)
         self.data: ModalInteractionData = ModalInteractionData(data=data["data"])
+        self._message_data: Optional[MessagePayload] = data.get("message")
 
-        if message_data := data.get("message"):
-            message = Message(state=self._state, channel=self.channel, data=message_data)
-        else:
-            message = None
-        self.message: Optional[Message] = message
+    @cached_slot_property("_cs_message")
+    def message(self) -> Optional[Message]:
+        """Optional[:class:`Message`]: The message that this interaction's modal originated from,
+        if the modal was sent in response to a component interaction.
+
+        .. versionadded:: 2.5
+        """
+        if message_data := self._message_data:
+            return Message(state=self._state, channel=self.channel, data=message_data)
+        return None
 
-    def walk_raw_components(self) -> Generator[ModalInteractionComponentDataPayload, None, None]:
-        """Returns a generator that yields raw component data from action rows one by one, as provided by Discord.
+    def walk_raw_components(self) -> Iterator[ModalInteractionComponentDataPayload]:
+        """Returns an iterator that yields raw component data from action rows one by one, as provided by Discord.
         This does not contain all fields of the components due to API limitations.
 
         .. versionadded:: 2.6
 
+        .. versionchanged:: 2.10
+            This now returns an iterator instead of a generator.
+
         Returns
         -------
-        Generator[:class:`dict`, None, None]
+        Iterator[:class:`dict`]
         """
-        for action_row in self.data.components:
-            yield from action_row["components"]
+        return chain.from_iterable(action_row["components"] for action_row in self.data.components)
 
     @cached_slot_property("_cs_text_values")
     def text_values(self) -> Dict[str, str]:
         """Dict[:class:`str`, :class:`str`]: Returns the text values the user has entered in the modal.
         This is a dict of the form ``{custom_id: value}``.
         """
-        text_input_type = ComponentType.text_input.value
         return {
             component["custom_id"]: component.get("value") or ""
-            for component in self.walk_raw_components()
-            if component.get("type") == text_input_type
+            for action_row in self.data.components
+            for component in action_row["components"]
+            if component["type"] == _TEXT_INPUT_TYPE
         }
 
     @property
@@ -132,11 +139,15 @@ class ModalInteraction(Interaction[ClientT]):
         return self.data.custom_id
 
 
-class ModalInteractionData(Dict[str, Any]):
+class ModalInteractionData(Mapping[str, Any]):
     """Represents the data of an interaction with a modal.
 
     .. versionadded:: 2.4
 
+    .. versionchanged:: 2.10
+        This is now a read-only mapping over the raw payload instead of a :class:`dict`
+        subclass, and the payload is no longer copied.
+
     Attributes
     ----------
     custom_id: :class:`str`
@@ -148,10 +159,10 @@ class ModalInteractionData(Dict[str, Any]):
         .. versionadded:: 2.6
     """
 
-    __slots__ = ("custom_id", "components")
+    __slots__ = ("custom_id", "components", "_raw")
 
     def __init__(self, *, data: ModalInteractionDataPayload) -> None:
-        super().__init__(data)
+        self._raw: ModalInteractionDataPayload = data
         self.custom_id: str = data["custom_id"]
         # This uses a stripped-down action row TypedDict, as we only receive
         # partial data from the API, generally only containing `type`, `custom_id`,
@@ -160,3 +171,12 @@ class ModalInteractionData(Dict[str, Any]):
 
     def __repr__(self) -> str:
         return f"<ModalInteractionData custom_id={self.custom_id!r} components={self.components!r}>"
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]  # type: ignore
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
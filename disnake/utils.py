@@ -466,12 +466,10 @@ def _unique(iterable: Iterable[T]) -> List[T]:
 
 
 def _get_as_snowflake(data: Any, key: str) -> Optional[int]:
-    try:
-        value = data[key]
-    except KeyError:
-        return None
-    else:
-        return value and int(value)
+    # optional fields are frequently missing entirely, and raising/catching
+    # a KeyError for those is considerably slower than a plain `.get`
+    value = data.get(key)
+    return value and int(value)
 
 
 def _maybe_cast(value: V, converter: Callable[[V], T], default: T = None) -> Optional[T]:
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from unittest import mock
+
+import pytest
+
+from disnake import ModalInteraction, ModalInteractionData
+
+if TYPE_CHECKING:
+    from disnake.types.interactions import ModalInteractionData as ModalInteractionDataPayload
+
+
+@pytest.fixture
+def payload() -> ModalInteractionDataPayload:
+    return {
+        "custom_id": "modal",
+        "components": [
+            {
+                "type": 1,
+                "components": [{"type": 4, "custom_id": "text", "value": "value"}],
+            },
+        ],
+    }
+
+
+class TestModalInteractionData:
+    def test_attributes(self, payload: ModalInteractionDataPayload) -> None:
+        data = ModalInteractionData(data=payload)
+        assert data.custom_id == "modal"
+        assert data.components is payload["components"]
+
+    def test_mapping(self, payload: ModalInteractionDataPayload) -> None:
+        data = ModalInteractionData(data=payload)
+
+        assert data["custom_id"] == "modal"
+        assert data.get("custom_id") == "modal"
+        assert data.get("missing") is None
+        assert "components" in data
+        assert "missing" not in data
+        assert len(data) == 2
+        assert list(data) == ["custom_id", "components"]
+        assert dict(data) == payload
+        assert data == payload
+
+
+class TestModalInteraction:
+    @pytest.fixture
+    def state(self) -> mock.Mock:
+        return mock.Mock()
+
+    def make_interaction(
+        self,
+        state: mock.Mock,
+        payload: ModalInteractionDataPayload,
+        message: Optional[Dict[str, Any]] = None,
+    ) -> ModalInteraction:
+        data: Dict[str, Any] = {
+            "id": "1",
+            "application_id": "2",
+            "type": 5,
+            "token": "token",
+            "version": 1,
+            "locale": "en-US",
+            "channel": {"id": "3", "type": 0},
+            "user": {"id": "4", "username": "user", "discriminator": "0", "avatar": None},
+            "data": payload,
+            "app_permissions": "0",
+        }
+        if message is not None:
+            data["message"] = message
+        return ModalInteraction(data=data, state=state)  # type: ignore
+
+    def test_message_missing(self, state, payload) -> None:
+        with mock.patch("disnake.interactions.modal.Message") as message_cls:
+            inter = self.make_interaction(state, payload)
+            assert inter.message is None
+        message_cls.assert_not_called()
+
+    def test_message_lazy(self, state, payload) -> None:
+        message_data = {"id": "5"}
+        with mock.patch("disnake.interactions.modal.Message") as message_cls:
+            inter = self.make_interaction(state, payload, message=message_data)
+            message_cls.assert_not_called()
+
+            message = inter.message
+            assert message is message_cls.return_value
+            assert inter.message is message
+
+        message_cls.assert_called_once_with(state=state, channel=inter.channel, data=message_data)
+
+    def test_walk_raw_components(self, state) -> None:
+        first = {"type": 4, "custom_id": "a", "value": "x"}
+        second = {"type": 3, "custom_id": "b", "values": []}
+        third = {"type": 4, "custom_id": "c", "value": "y"}
+        payload: Dict[str, Any] = {
+            "custom_id": "modal",
+            "components": [
+                {"type": 1, "components": [first, second]},
+                {"type": 1, "components": [third]},
+            ],
+        }
+        inter = self.make_interaction(state, payload)  # type: ignore
+
+        assert list(inter.walk_raw_components()) == [first, second, third]
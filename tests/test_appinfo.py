@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: MIT
+
+import json
+import warnings
+from typing import Any, Dict, Union
+from unittest import mock
+
+import pytest
+
+from disnake import AppInfo, InstallParams, PartialAppInfo, Permissions, Team, utils
+from disnake.state import ConnectionState
+from disnake.types import appinfo as appinfo_types
+
+
+@pytest.fixture
+def state() -> mock.Mock:
+    return mock.Mock(ConnectionState)
+
+
+def make_payload(**kwargs: Any) -> appinfo_types.AppInfo:
+    data: Dict[str, Any] = {
+        "id": "1234",
+        "name": "app",
+        "icon": None,
+        "description": "description",
+        "summary": "",
+        "verify_key": "key",
+        "rpc_origins": [],
+        "bot_public": True,
+        "bot_require_code_grant": False,
+        "owner": {"id": "5678", "username": "owner", "discriminator": "0", "avatar": None},
+    }
+    data.update(kwargs)
+    return data  # type: ignore
+
+
+class TestAppInfo:
+    @pytest.mark.parametrize("team", [None, {}])
+    def test_team_missing(self, state, team) -> None:
+        payload = make_payload() if team is None else make_payload(team=team)
+        assert AppInfo(state, payload).team is None
+
+    def test_team(self, state) -> None:
+        app = AppInfo(
+            state,
+            make_payload(
+                team={
+                    "id": "42",
+                    "name": "team",
+                    "icon": None,
+                    "owner_user_id": "5678",
+                    "members": [],
+                }
+            ),
+        )
+
+        team = app.team
+        assert isinstance(team, Team)
+        assert team.id == 42
+        assert app.team is team
+
+    def test_team_lazy(self, state) -> None:
+        with mock.patch("disnake.team.Team") as team_cls:
+            app = AppInfo(state, make_payload(team={"id": "42"}))
+            team_cls.assert_not_called()
+
+            assert app.team is team_cls.return_value
+            assert app.team is team_cls.return_value
+
+        team_cls.assert_called_once_with(state, {"id": "42"})
+
+    def test_install_params_missing(self, state) -> None:
+        assert AppInfo(state, make_payload()).install_params is None
+
+    def test_install_params(self, state) -> None:
+        app = AppInfo(
+            state,
+            make_payload(
+                install_params={"scopes": ["bot", "applications.commands"], "permissions": "8"}
+            ),
+        )
+
+        install_params = app.install_params
+        assert isinstance(install_params, InstallParams)
+        assert app.install_params is install_params
+        assert install_params.to_url() == (
+            "https://discord.com/oauth2/authorize?client_id=1234"
+            "&scope=bot+applications.commands&permissions=8"
+        )
+
+    def test_install_params_lazy(self, state) -> None:
+        install_params_data = {"scopes": ["bot"], "permissions": "8"}
+        with mock.patch("disnake.appinfo.InstallParams") as install_params_cls:
+            app = AppInfo(state, make_payload(install_params=install_params_data))
+            install_params_cls.assert_not_called()
+
+            assert app.install_params is install_params_cls.return_value
+            assert app.install_params is install_params_cls.return_value
+
+        install_params_cls.assert_called_once_with(install_params_data, parent=app)
+
+    @pytest.mark.parametrize("permissions", ["8", 8])
+    def test_install_params_permissions(self, state, permissions) -> None:
+        app = AppInfo(
+            state, make_payload(install_params={"scopes": ["bot"], "permissions": permissions})
+        )
+        assert app.install_params is not None
+        assert app.install_params.permissions == Permissions(administrator=True)
+
+    @pytest.mark.parametrize("encode", [str, str.encode])
+    def test_from_bytes(self, state, encode) -> None:
+        payload = make_payload(
+            guild_id="42", install_params={"scopes": ["bot"], "permissions": "8"}
+        )
+        raw: Union[str, bytes] = encode(json.dumps(payload))
+
+        with mock.patch.object(utils, "_from_json", wraps=utils._from_json) as from_json:
+            app = AppInfo.from_bytes(state, raw)
+        from_json.assert_called_once_with(raw)
+
+        assert isinstance(app, AppInfo)
+        assert app._state is state
+        assert app.id == 1234
+        assert app.name == "app"
+        assert app.description == "description"
+        assert app.guild_id == 42
+        assert app.primary_sku_id is None
+        assert app.install_params is not None
+        assert app.install_params.scopes == ("bot",)
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda state: AppInfo(state, make_payload()),
+        lambda state: PartialAppInfo(state=state, data=make_payload()),
+    ],
+)
+def test_summary_warns_once_per_instance(state, factory) -> None:
+    app = factory(state)
+    with warnings.catch_warnings(record=True) as w:
+        assert app.summary == ""
+        assert app.summary == ""
+    assert len(w) == 1
+    assert issubclass(w[0].category, DeprecationWarning)
+
+    with pytest.warns(DeprecationWarning):
+        assert factory(state).summary == ""